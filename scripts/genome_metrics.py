@@ -6,13 +6,28 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import mmap
+import os
 import re
 import shutil
 import subprocess
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
+
+# Raw-line markers for records that can carry an accession; other report lines are never decoded.
+ACCESSION_KEYS_BYTES = (b'"accession"', b'"assembly_accession"', b'"currentAccession"')
 
 IS_KEYWORDS = [
     "insertion sequence",
@@ -25,6 +40,22 @@ IS_KEYWORDS = [
 
 IS_REGEX = re.compile(r"\bIS\d+\b", re.IGNORECASE)
 
+IS_ATTRIBUTE_KEYS = ("product", "note", "gene", "mobile_element_type")
+
+IS_FEATURE_TYPES = frozenset({"mobile_element", "repeat_region", "insertion_sequence", "transposable_element"})
+
+# Byte-level counterparts used to pre-filter raw GFF rows before any attribute parsing.
+IS_FEATURE_TYPES_BYTES = frozenset(feature_type.encode() for feature_type in IS_FEATURE_TYPES)
+# is_is_element tests keywords against lower-cased values, so a keyword containing
+# upper case (e.g. "IS element") can never match and is left out of the pre-filter.
+IS_KEYWORDS_BYTES = tuple(word.encode() for word in IS_KEYWORDS if word == word.lower())
+WORD_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+DIGIT_BYTES = frozenset(b"0123456789")
+
+GC_BYTES = np.frombuffer(b"GCgc", dtype=np.uint8)
+N_BYTES = np.frombuffer(b"Nn", dtype=np.uint8)
+WHITESPACE_BYTES = np.frombuffer(b" \t\n\r\x0b\x0c", dtype=np.uint8)
+
 
 @dataclass
 class AssemblyMeta:
@@ -73,21 +104,37 @@ def unzip_dataset(zip_path: Path, dataset_root: Path, force: bool) -> Path:
     return dataset_root
 
 
+CURATION_COLUMNS = ("assembly_accession", "species", "factoid", "display_species", "display_strain_name")
+
+
+def column_indices(header: List[str], names: Iterable[str]) -> Dict[str, Optional[int]]:
+    return {name: header.index(name) if name in header else None for name in names}
+
+
+def csv_field(row: List[str], index: Optional[int]) -> str:
+    if index is None or index >= len(row):
+        return ""
+    return row[index].strip()
+
+
 def load_curation(path: Optional[Path]) -> Dict[str, Dict[str, str]]:
     if not path or not path.exists():
         return {}
     curation: Dict[str, Dict[str, str]] = {}
     with path.open("r", newline="") as handle:
-        reader = csv.DictReader(handle)
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if not header:
+            return curation
+        idx = column_indices(header, CURATION_COLUMNS)
         for row in reader:
-            species = (row.get("species") or "").strip()
-            accession = (row.get("assembly_accession") or "").strip()
+            accession = csv_field(row, idx["assembly_accession"])
             if accession:
                 curation[accession] = {
-                    "species": species,
-                    "factoid": (row.get("factoid") or "").strip(),
-                    "display_species": (row.get("display_species") or "").strip(),
-                    "display_strain_name": (row.get("display_strain_name") or "").strip(),
+                    "species": csv_field(row, idx["species"]),
+                    "factoid": csv_field(row, idx["factoid"]),
+                    "display_species": csv_field(row, idx["display_species"]),
+                    "display_strain_name": csv_field(row, idx["display_strain_name"]),
                 }
     return curation
 
@@ -97,33 +144,27 @@ def load_metadata(report_path: Path) -> Dict[str, AssemblyMeta]:
     if not report_path.exists():
         return meta
 
-    with report_path.open("r") as handle:
+    with report_path.open("rb") as handle:
         for line in handle:
-            line = line.strip()
-            if not line:
+            if not any(key in line for key in ACCESSION_KEYS_BYTES):
                 continue
-            record = json.loads(line)
+            record = json_loads(line)
             accession = record.get("accession") or record.get("assembly_accession") or record.get("currentAccession")
-            organism = record.get("organism", {})
-            species = (
-                organism.get("organismName")
-                or organism.get("organism_name")
-                or organism.get("taxon", {}).get("name")
-            )
-            taxonomy_id = organism.get("tax_id") or organism.get("taxId") or organism.get("taxon", {}).get("tax_id")
+            organism = record.get("organism") or {}
+            taxon = organism.get("taxon") or {}
             assembly_info = record.get("assemblyInfo") or {}
             assembly_stats = record.get("assemblyStats") or {}
-            annotation_info = record.get("annotationInfo") or {}
-            annotation_stats = annotation_info.get("stats", {})
-            gene_counts = annotation_stats.get("geneCounts", {})
-            ani_info = record.get("averageNucleotideIdentity") or {}
-            ani_best = ani_info.get("bestAniMatch") or {}
+            annotation_stats = (record.get("annotationInfo") or {}).get("stats") or {}
+            gene_counts = annotation_stats.get("geneCounts") or {}
+            ani_best = (record.get("averageNucleotideIdentity") or {}).get("bestAniMatch") or {}
 
+            species = organism.get("organismName") or organism.get("organism_name") or taxon.get("name")
+            taxonomy_id = organism.get("tax_id") or organism.get("taxId") or taxon.get("tax_id")
             assembly_level = record.get("assembly_level") or assembly_info.get("assemblyLevel")
             release_date = record.get("release_date") or assembly_info.get("releaseDate")
-            strain = organism.get("infraspecific_names", {}).get("strain") or organism.get("infraspecificNames", {}).get(
-                "strain"
-            )
+            strain = (organism.get("infraspecific_names") or {}).get("strain") or (
+                organism.get("infraspecificNames") or {}
+            ).get("strain")
             species_ani = ani_best.get("organismName")
 
             total_sequence_length = assembly_stats.get("totalSequenceLength")
@@ -153,18 +194,36 @@ def load_metadata(report_path: Path) -> Dict[str, AssemblyMeta]:
     return meta
 
 
+def fasta_sequence_spans(buf: mmap.mmap) -> Iterator[Tuple[int, int]]:
+    size = len(buf)
+    pos = 0
+    while pos < size:
+        if buf[pos] == ord(">"):
+            eol = buf.find(b"\n", pos)
+            if eol == -1:
+                return
+            pos = eol + 1
+            continue
+        header = buf.find(b"\n>", pos)
+        end = size if header == -1 else header + 1
+        yield pos, end
+        pos = end
+
+
 def parse_fasta(path: Path) -> Tuple[int, int, int]:
-    total_len = 0
-    gc = 0
-    n_count = 0
-    with path.open("r") as handle:
-        for line in handle:
-            if not line or line.startswith(">"):
-                continue
-            seq = line.strip().upper()
-            total_len += len(seq)
-            gc += seq.count("G") + seq.count("C")
-            n_count += seq.count("N")
+    hist = np.zeros(256, dtype=np.int64)
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return 0, 0, 0
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            for start, end in fasta_sequence_spans(buf):
+                block = np.frombuffer(buf, dtype=np.uint8, count=end - start, offset=start)
+                hist += np.bincount(block, minlength=256)
+                del block
+
+    total_len = int(hist.sum() - hist[WHITESPACE_BYTES].sum())
+    gc = int(hist[GC_BYTES].sum())
+    n_count = int(hist[N_BYTES].sum())
     return total_len, gc, n_count
 
 
@@ -174,60 +233,81 @@ def parse_gff(path: Path) -> Tuple[int, int, int, int]:
     is_elements = 0
     trnas = 0
 
-    with path.open("r") as handle:
+    with path.open("rb") as handle:
         for line in handle:
-            if not line or line.startswith("#"):
+            if not line or line.startswith(b"#"):
                 continue
-            parts = line.rstrip("\n").split("\t")
+            parts = line.split(b"\t", 9)
             if len(parts) < 9:
                 continue
             feature_type = parts[2]
-            attrs = parse_gff_attributes(parts[8])
+            attr_bytes = parts[8].rstrip(b"\r\n")
 
-            if feature_type == "CDS":
+            if feature_type == b"CDS":
                 total_cdss += 1
-                if "pseudo" in attrs or attrs.get("pseudogene"):
-                    pseudogenes += 1
-
-            if feature_type == "pseudogene":
+                if b"pseudo" in attr_bytes:
+                    attrs = parse_gff_attributes(attr_bytes.decode())
+                    if "pseudo" in attrs or attrs.get("pseudogene"):
+                        pseudogenes += 1
+            elif feature_type == b"pseudogene":
                 pseudogenes += 1
-
-            if feature_type == "tRNA":
+            elif feature_type == b"tRNA":
                 trnas += 1
 
-            if is_is_element(feature_type, attrs):
+            if feature_type in IS_FEATURE_TYPES_BYTES:
                 is_elements += 1
+            elif may_be_is_element(attr_bytes):
+                if is_is_element(feature_type.decode(), parse_gff_attributes(attr_bytes.decode())):
+                    is_elements += 1
 
     return total_cdss, pseudogenes, is_elements, trnas
 
 
+def may_be_is_element(attr_bytes: bytes) -> bool:
+    lower = attr_bytes.lower()
+    for word in IS_KEYWORDS_BYTES:
+        if word in lower:
+            return True
+    return has_is_token(lower)
+
+
+def has_is_token(lower: bytes) -> bool:
+    # Byte-level equivalent of IS_REGEX for already lower-cased input.
+    size = len(lower)
+    pos = lower.find(b"is")
+    while pos != -1:
+        if pos == 0 or lower[pos - 1] not in WORD_BYTES:
+            end = pos + 2
+            while end < size and lower[end] in DIGIT_BYTES:
+                end += 1
+            if end > pos + 2 and (end == size or lower[end] not in WORD_BYTES):
+                return True
+        pos = lower.find(b"is", pos + 2)
+    return False
+
+
 def parse_gff_attributes(attr_text: str) -> Dict[str, str]:
     attrs: Dict[str, str] = {}
     for item in attr_text.split(";"):
         if not item:
             continue
-        if "=" in item:
-            key, value = item.split("=", 1)
-            attrs[key] = value
-        else:
-            attrs[item] = ""
+        key, _, value = item.partition("=")
+        attrs[key] = value
     return attrs
 
 
 def is_is_element(feature_type: str, attrs: Dict[str, str]) -> bool:
-    if feature_type in {"mobile_element", "repeat_region", "insertion_sequence", "transposable_element"}:
+    if feature_type in IS_FEATURE_TYPES:
         return True
 
-    for key in ("product", "note", "gene", "mobile_element_type"):
-        value = attrs.get(key, "")
-        if not value:
-            continue
-        lower = value.lower()
-        if any(word in lower for word in IS_KEYWORDS):
-            return True
-        if IS_REGEX.search(value):
-            return True
-    return False
+    # Newline-joined so neither a keyword nor IS_REGEX can match across two values.
+    combined = "\n".join(value for key in IS_ATTRIBUTE_KEYS if (value := attrs.get(key)))
+    if not combined:
+        return False
+    lower = combined.lower()
+    if any(word in lower for word in IS_KEYWORDS):
+        return True
+    return IS_REGEX.search(combined) is not None
 
 
 def find_assemblies(dataset_root: Path) -> List[Path]:
@@ -242,20 +322,46 @@ def find_assemblies(dataset_root: Path) -> List[Path]:
     return assembly_dirs
 
 
+def find_assembly_files(assembly_dir: Path) -> Tuple[List[Path], List[Path]]:
+    fasta_files: List[Path] = []
+    gff_files: List[Path] = []
+    gff3_files: List[Path] = []
+    for dirpath, _, filenames in os.walk(assembly_dir):
+        for name in filenames:
+            if name.endswith(".fna"):
+                fasta_files.append(Path(dirpath, name))
+            elif name.endswith(".gff"):
+                gff_files.append(Path(dirpath, name))
+            elif name.endswith(".gff3"):
+                gff3_files.append(Path(dirpath, name))
+    return fasta_files, gff_files + gff3_files
+
+
 def pick_file(paths: Iterable[Path], preferred_tokens: List[str]) -> Optional[Path]:
-    paths = list(paths)
-    for token in preferred_tokens:
-        for p in paths:
-            if token in p.name:
-                return p
-    return paths[0] if paths else None
+    first: Optional[Path] = None
+    best: Optional[Path] = None
+    best_rank = len(preferred_tokens)
+    for p in paths:
+        if first is None:
+            first = p
+        name = p.name
+        for rank, token in enumerate(preferred_tokens[:best_rank]):
+            if token in name:
+                best, best_rank = p, rank
+                break
+        if best_rank == 0:
+            break
+    return best or first
 
 
 def load_reference_rows(path: Path) -> List[Dict[str, object]]:
     if not path.exists():
         return []
-    if path.suffix.lower() == ".json":
-        return json.loads(path.read_text())
+    if path.suffix.lower() in {".json", ".jsonl", ".ndjson"}:
+        data = path.read_bytes()
+        if data.lstrip()[:1] == b"[":
+            return json_loads(data)
+        return [json_loads(line) for line in data.splitlines() if line.strip()]
 
     rows: List[Dict[str, object]] = []
     with path.open("r", newline="") as handle:
@@ -283,8 +389,7 @@ def select_assembly_dir(dataset_root: Path, accession: str) -> Optional[Path]:
 def assemble_metrics(
     assembly_dir: Path, meta_map: Dict[str, AssemblyMeta], curation: Dict[str, Dict[str, str]]
 ) -> Optional[Dict[str, object]]:
-    fasta_files = list(assembly_dir.rglob("*.fna"))
-    gff_files = list(assembly_dir.rglob("*.gff")) + list(assembly_dir.rglob("*.gff3"))
+    fasta_files, gff_files = find_assembly_files(assembly_dir)
 
     fasta_path = pick_file(fasta_files, ["genomic.fna", "genome.fna"])
     gff_path = pick_file(gff_files, ["genomic.gff", "genome.gff", ".gff3"])
@@ -343,8 +448,49 @@ def assemble_metrics(
     }
 
 
+def accession_paths(work_dir: Path, accession: str) -> Tuple[Path, Path]:
+    accession_dir = work_dir / "assemblies" / accession
+    return accession_dir / "ncbi_dataset.zip", accession_dir / "ncbi_dataset"
+
+
+def download_accession(work_dir: Path, accession: str, force: bool) -> None:
+    zip_path, _ = accession_paths(work_dir, accession)
+    if zip_path.exists() and not force:
+        print(f"Using cached download for {accession}")
+        return
+    run_accession_download(zip_path, accession)
+
+
+def process_accession(accession: str, options: Dict[str, object]) -> Optional[Dict[str, object]]:
+    zip_path, dataset_root = accession_paths(Path(options["work_dir"]), accession)
+    dataset_root = unzip_dataset(zip_path, dataset_root, options["force"])
+    report_path = dataset_root / "data" / "assembly_data_report.jsonl"
+    meta_map = load_metadata(report_path)
+
+    assembly_dir = select_assembly_dir(dataset_root, accession)
+    if not assembly_dir:
+        return None
+
+    return assemble_metrics(assembly_dir, meta_map, options["curation"])
+
+
+def annotate_row(row: Dict[str, object], ref_row: Dict[str, object]) -> Dict[str, object]:
+    if "taxid_input" in ref_row and "taxid_input" not in row:
+        row["taxid_input"] = ref_row.get("taxid_input")
+    if "phylum" in ref_row:
+        row["phylum"] = ref_row.get("phylum")
+    if "gram_stain" in ref_row:
+        row["gram_stain"] = ref_row.get("gram_stain")
+    if "who_priority" in ref_row:
+        row["who_priority"] = ref_row.get("who_priority")
+    return row
+
+
 def write_json(rows: List[Dict[str, object]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson:
+        path.write_bytes(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+        return
     with path.open("w") as handle:
         json.dump(rows, handle, indent=2)
 
@@ -360,24 +506,27 @@ def write_csv(rows: List[Dict[str, object]], path: Path) -> None:
             if key not in seen:
                 seen.add(key)
                 fieldnames.append(key)
+    table = [[row.get(field, "") for field in fieldnames] for row in rows]
     with path.open("w", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(table)
 
 
 def append_missing_curation(path: Path, rows: List[Dict[str, object]]) -> None:
-    existing: Dict[str, Dict[str, str]] = {}
-    fieldnames = ["assembly_accession", "species", "factoid", "display_species", "display_strain_name"]
+    existing: Set[str] = set()
+    fieldnames = list(CURATION_COLUMNS)
     if path.exists():
         with path.open("r", newline="") as handle:
-            reader = csv.DictReader(handle)
-            if reader.fieldnames:
-                fieldnames = list(reader.fieldnames)
-            for row in reader:
-                accession = (row.get("assembly_accession") or "").strip()
-                if accession:
-                    existing[accession] = row
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header:
+                fieldnames = header
+                accession_idx = header.index("assembly_accession") if "assembly_accession" in header else None
+                for row in reader:
+                    accession = csv_field(row, accession_idx)
+                    if accession:
+                        existing.add(accession)
     else:
         path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -420,6 +569,18 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--curation", default="data/curation.csv", help="Curation CSV path.")
     parser.add_argument("--skip-download", action="store_true", help="Skip NCBI download step.")
     parser.add_argument("--force", action="store_true", help="Force re-extraction of dataset.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Parallel workers for parsing assemblies (default: CPU count).",
+    )
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=4,
+        help="Parallel NCBI downloads (default: 4).",
+    )
     return parser.parse_args()
 
 
@@ -439,41 +600,28 @@ def main() -> int:
     curation_path = Path(args.curation) if args.curation else None
     curation = load_curation(curation_path)
 
-    rows: List[Dict[str, object]] = []
-    for ref_row in reference_rows:
-        accession = extract_accession(ref_row)
-        if not accession:
-            continue
+    # Several taxids can resolve to the same reference assembly; each distinct accession is downloaded,
+    # extracted and parsed exactly once so no two workers share a zip or dataset directory.
+    accessions = list(dict.fromkeys(accession for accession in map(extract_accession, reference_rows) if accession))
 
-        accession_dir = work_dir / "assemblies" / accession
-        zip_path = accession_dir / "ncbi_dataset.zip"
-        dataset_root = accession_dir / "ncbi_dataset"
+    if not args.skip_download:
+        with ThreadPoolExecutor(max_workers=args.download_workers) as executor:
+            downloads = [executor.submit(download_accession, work_dir, accession, args.force) for accession in accessions]
+            for future in as_completed(downloads):
+                future.result()
 
-        if not args.skip_download:
-            if zip_path.exists() and not args.force:
-                print(f"Using cached download for {accession}")
-            else:
-                run_accession_download(zip_path, accession)
+    options = {"work_dir": str(work_dir), "force": args.force, "curation": curation}
+    metrics: Dict[str, Optional[Dict[str, object]]] = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(process_accession, accession, options): accession for accession in accessions}
+        for future in as_completed(futures):
+            metrics[futures[future]] = future.result()
 
-        dataset_root = unzip_dataset(zip_path, dataset_root, args.force)
-        report_path = dataset_root / "data" / "assembly_data_report.jsonl"
-        meta_map = load_metadata(report_path)
-
-        assembly_dir = select_assembly_dir(dataset_root, accession)
-        if not assembly_dir:
-            continue
-
-        row = assemble_metrics(assembly_dir, meta_map, curation)
+    rows: List[Dict[str, object]] = []
+    for ref_row in reference_rows:
+        row = metrics.get(extract_accession(ref_row))
         if row:
-            if "taxid_input" in ref_row and "taxid_input" not in row:
-                row["taxid_input"] = ref_row.get("taxid_input")
-            if "phylum" in ref_row:
-                row["phylum"] = ref_row.get("phylum")
-            if "gram_stain" in ref_row:
-                row["gram_stain"] = ref_row.get("gram_stain")
-            if "who_priority" in ref_row:
-                row["who_priority"] = ref_row.get("who_priority")
-            rows.append(row)
+            rows.append(annotate_row(dict(row), ref_row))
 
     if not rows:
         print("No assemblies found. Check that the dataset includes genome + gff3 files.")
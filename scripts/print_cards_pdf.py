@@ -5,10 +5,13 @@ from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from itertools import islice
 import math
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Sequence
+from typing import Iterable, Iterator, List
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -43,7 +46,22 @@ def hex_color(value: str) -> colors.Color:
     return colors.HexColor(f"#{value}")
 
 
-@dataclass
+# Palette loosely matches the web UI
+CARD_BG = hex_color("fff9f0")
+CARD_BORDER = hex_color("1f2326")
+ACCENT = hex_color("ff8f2f")
+INK = hex_color("12202a")
+INK_SOFT = hex_color("3d4a55")
+FACTOID_BG = colors.Color(0.07, 0.12, 0.16, alpha=0.06)
+FACTOID_BORDER = colors.Color(0.07, 0.12, 0.16, alpha=0.15)
+METRIC_RULE = colors.Color(0.07, 0.12, 0.16, alpha=0.18)
+
+CARD_RADIUS = 14
+CARD_PADDING = 12
+CARD_BORDER_WIDTH = 2.2
+
+
+@dataclass(slots=True, frozen=True)
 class GenomeRow:
     species: str
     species_ani: str | None
@@ -63,97 +81,87 @@ class GenomeRow:
     factoid: str | None
 
 
+def format_decimal(value: float) -> str:
+    return f"{int(value)}" if value.is_integer() else f"{value:.2f}"
+
+
+# (label, getter, formatter); formatters follow the GenomeRow field types and never see None.
 METRICS = [
-    ("Genome size (Mb)", "genome_size_mb"),
-    ("Total CDS", "total_cdss"),
-    ("Pseudogenes", "pseudogenes"),
-    ("tRNA", "trna"),
-    ("GC content (%)", "gc_content_pct"),
-    ("IS elements / Mb", "is_elements_per_mb"),
-    ("Release date", "release_date"),
+    ("Genome size (Mb)", attrgetter("genome_size_mb"), format_decimal),
+    ("Total CDS", attrgetter("total_cdss"), str),
+    ("Pseudogenes", attrgetter("pseudogenes"), str),
+    ("tRNA", attrgetter("trna"), str),
+    ("GC content (%)", attrgetter("gc_content_pct"), format_decimal),
+    ("IS elements / Mb", attrgetter("is_elements_per_mb"), format_decimal),
+    ("Release date", attrgetter("release_date"), str),
 ]
 
 
 def load_rows(path: Path) -> List[GenomeRow]:
-    data = json.loads(path.read_text())
-    rows: List[GenomeRow] = []
-    for row in data:
-        rows.append(
-            GenomeRow(
-                species=row.get("species", "Unknown"),
-                species_ani=row.get("species_ani"),
-                assembly_accession=row.get("assembly_accession"),
-                strain=row.get("strain"),
-                display_strain_name=row.get("display_strain_name"),
-                phylum=row.get("phylum"),
-                gram_stain=row.get("gram_stain"),
-                who_priority=parse_bool(row.get("who_priority")),
-                genome_size_mb=float(row.get("genome_size_mb", 0)),
-                total_cdss=int(row.get("total_cdss", 0)),
-                pseudogenes=int(row.get("pseudogenes", 0)),
-                trna=int(row.get("trna", 0)),
-                gc_content_pct=float(row.get("gc_content_pct", 0)),
-                is_elements_per_mb=float(row.get("is_elements_per_mb", 0)),
-                release_date=row.get("release_date"),
-                factoid=row.get("factoid"),
-            )
-        )
-    return rows
+    data = json.loads(path.read_bytes())
+    return [genome_row(row) for row in data]
 
 
-def wrap_text(text: str, font: str, size: float, max_width: float) -> List[str]:
-    words = text.split()
-    lines: List[str] = []
-    current = []
-    for word in words:
-        candidate = " ".join(current + [word])
-        if stringWidth(candidate, font, size) <= max_width:
-            current.append(word)
+def genome_row(record: dict) -> GenomeRow:
+    values = []
+    for name, cast, default in ROW_SCHEMA:
+        value = record.get(name, default)
+        values.append(value if cast is None else cast(value))
+    return GenomeRow(*values)
+
+
+@lru_cache(maxsize=None)
+def string_width(text: str, font: str, size: float) -> float:
+    return stringWidth(text, font, size)
+
+
+def greedy_line_starts(widths: List[float], space_width: float, max_width: float) -> List[int]:
+    # Index of the first word on each line; a word wider than max_width still gets a line of its own.
+    starts: List[int] = []
+    line_width = 0.0
+    for index, width in enumerate(widths):
+        if starts and line_width + space_width + width <= max_width:
+            line_width += space_width + width
         else:
-            if current:
-                lines.append(" ".join(current))
-            current = [word]
-    if current:
-        lines.append(" ".join(current))
-    return lines
+            starts.append(index)
+            line_width = width
+    return starts
+
+
+@lru_cache(maxsize=4096)
+def wrap_text(text: str, font: str, size: float, max_width: float) -> tuple[str, ...]:
+    words = text.split()
+    widths = [string_width(word, font, size) for word in words]
+    starts = greedy_line_starts(widths, string_width(" ", font, size), max_width)
+    ends = starts[1:] + [len(words)]
+    return tuple(" ".join(words[start:end]) for start, end in zip(starts, ends))
 
 
 def draw_italic_line(c: canvas.Canvas, x: float, y: float, text: str, font: str, size: float) -> None:
-    c.saveState()
-    c.setFont(font, size)
-    c.translate(x, y)
-    c.transform(1, 0, 0.18, 1, 0, 0)
-    c.drawString(0, 0, text)
-    c.restoreState()
+    # Shear via the text matrix rather than the CTM, so no q/Q pair is needed and the canvas font is untouched.
+    text_object = c.beginText()
+    text_object.setTextTransform(1, 0, 0.18, 1, x, y)
+    text_object.setFont(font, size)
+    text_object.textOut(text)
+    c.drawText(text_object)
+
+
+# Unit vectors for the ten star vertices, starting at the top and alternating outer/inner.
+STAR_UNIT_POINTS = tuple(
+    (math.cos(math.radians(i * 36 - 90)), math.sin(math.radians(i * 36 - 90))) for i in range(10)
+)
 
 
 def draw_star(c: canvas.Canvas, cx: float, cy: float, outer: float, inner: float) -> None:
-    points = []
-    for i in range(10):
-        angle = (i * 36) - 90
-        radius = outer if i % 2 == 0 else inner
-        rad = angle * 3.1415926535 / 180
-        x = cx + radius * (math.cos(rad))
-        y = cy + radius * (math.sin(rad))
-        points.append((x, y))
     path = c.beginPath()
-    path.moveTo(points[0][0], points[0][1])
-    for x, y in points[1:]:
-        path.lineTo(x, y)
+    start_x, start_y = STAR_UNIT_POINTS[0]
+    path.moveTo(cx + outer * start_x, cy + outer * start_y)
+    for (unit_x, unit_y), radius in zip(STAR_UNIT_POINTS[1:], (inner, outer) * 5):
+        path.lineTo(cx + radius * unit_x, cy + radius * unit_y)
     path.close()
     c.drawPath(path, stroke=0, fill=1)
 
 
-def format_metric(value: float | int | str | None) -> str:
-    if value is None:
-        return "N/A"
-    if isinstance(value, str):
-        return value
-    if isinstance(value, float) and not value.is_integer():
-        return f"{value:.2f}"
-    return f"{int(value)}"
-
-
 def parse_bool(value: object) -> bool:
     if isinstance(value, bool):
         return value
@@ -162,6 +170,29 @@ def parse_bool(value: object) -> bool:
     return str(value).strip().lower() in {"1", "true", "yes", "y"}
 
 
+ROW_CASTS = {
+    "who_priority": parse_bool,
+    "genome_size_mb": float,
+    "total_cdss": int,
+    "pseudogenes": int,
+    "trna": int,
+    "gc_content_pct": float,
+    "is_elements_per_mb": float,
+}
+ROW_DEFAULTS = {
+    "species": "Unknown",
+    "genome_size_mb": 0,
+    "total_cdss": 0,
+    "pseudogenes": 0,
+    "trna": 0,
+    "gc_content_pct": 0,
+    "is_elements_per_mb": 0,
+}
+# (name, cast, default) in GenomeRow field order, so load_rows can build rows positionally.
+ROW_SCHEMA = tuple((field.name, ROW_CASTS.get(field.name), ROW_DEFAULTS.get(field.name)) for field in fields(GenomeRow))
+
+
+@lru_cache(maxsize=64)
 def gram_key_from_value(value: str | None) -> str:
     gram = (value or "").lower()
     if "positive" in gram:
@@ -173,12 +204,15 @@ def gram_key_from_value(value: str | None) -> str:
     return "neutral"
 
 
+GRAM_BORDER_COLORS = {
+    "positive": colors.Color(0.47, 0.34, 0.79, alpha=0.9),
+    "negative": colors.Color(0.86, 0.4, 0.52, alpha=0.9),
+    "neutral": colors.Color(0.43, 0.46, 0.49, alpha=0.8),
+}
+
+
 def gram_border_color(key: str, fallback: colors.Color) -> colors.Color:
-    if key == "positive":
-        return colors.Color(0.47, 0.34, 0.79, alpha=0.9)
-    if key == "negative":
-        return colors.Color(0.86, 0.4, 0.52, alpha=0.9)
-    return colors.Color(0.43, 0.46, 0.49, alpha=0.8)
+    return GRAM_BORDER_COLORS.get(key, GRAM_BORDER_COLORS["neutral"])
 
 
 def gram_label_from_key(key: str, raw: str | None) -> tuple[str, str]:
@@ -189,54 +223,102 @@ def gram_label_from_key(key: str, raw: str | None) -> tuple[str, str]:
     return (raw or "Atypical").upper(), raw or "Atypical"
 
 
+GRAM_PILL_COLORS = {
+    "positive": (colors.Color(0.47, 0.34, 0.79, alpha=0.18), hex_color("2f1f61")),
+    "negative": (colors.Color(0.86, 0.4, 0.52, alpha=0.18), hex_color("6b2338")),
+    "neutral": (colors.Color(0.43, 0.46, 0.49, alpha=0.18), hex_color("2f3438")),
+}
+
+
 def gram_pill_colors(key: str) -> tuple[colors.Color, colors.Color]:
-    if key == "positive":
-        return colors.Color(0.47, 0.34, 0.79, alpha=0.18), hex_color("2f1f61")
-    if key == "negative":
-        return colors.Color(0.86, 0.4, 0.52, alpha=0.18), hex_color("6b2338")
-    return colors.Color(0.43, 0.46, 0.49, alpha=0.18), hex_color("2f3438")
+    return GRAM_PILL_COLORS.get(key, GRAM_PILL_COLORS["neutral"])
+
+
+PHYLUM_PALETTE = {
+    "firmicutes": (colors.Color(0.13, 0.42, 0.36, alpha=0.16), hex_color("1f4f44")),
+    "proteobacteria": (colors.Color(0.75, 0.43, 0.13, alpha=0.16), hex_color("6d3e11")),
+    "actinobacteria": (colors.Color(0.81, 0.29, 0.28, alpha=0.16), hex_color("6a1f1e")),
+    "bacteroidetes": (colors.Color(0.15, 0.51, 0.67, alpha=0.16), hex_color("0c4f68")),
+    "campylobacterota": (colors.Color(0.21, 0.56, 0.42, alpha=0.16), hex_color("1f5a43")),
+    "chlamydiota": (colors.Color(0.69, 0.54, 0.19, alpha=0.16), hex_color("6a4e12")),
+    "mycoplasmatota": (colors.Color(0.47, 0.5, 0.53, alpha=0.16), hex_color("3f454b")),
+}
+PHYLUM_FALLBACK_COLORS = (colors.Color(0.07, 0.12, 0.16, alpha=0.08), INK_SOFT)
 
 
+@lru_cache(maxsize=64)
 def phylum_colors(phylum: str) -> tuple[colors.Color, colors.Color]:
-    key = phylum.strip().lower()
-    palette = {
-        "firmicutes": (colors.Color(0.13, 0.42, 0.36, alpha=0.16), hex_color("1f4f44")),
-        "proteobacteria": (colors.Color(0.75, 0.43, 0.13, alpha=0.16), hex_color("6d3e11")),
-        "actinobacteria": (colors.Color(0.81, 0.29, 0.28, alpha=0.16), hex_color("6a1f1e")),
-        "bacteroidetes": (colors.Color(0.15, 0.51, 0.67, alpha=0.16), hex_color("0c4f68")),
-        "campylobacterota": (colors.Color(0.21, 0.56, 0.42, alpha=0.16), hex_color("1f5a43")),
-        "chlamydiota": (colors.Color(0.69, 0.54, 0.19, alpha=0.16), hex_color("6a4e12")),
-        "mycoplasmatota": (colors.Color(0.47, 0.5, 0.53, alpha=0.16), hex_color("3f454b")),
-    }
-    return palette.get(key, (colors.Color(0.07, 0.12, 0.16, alpha=0.08), hex_color("3d4a55")))
+    return PHYLUM_PALETTE.get(phylum.strip().lower(), PHYLUM_FALLBACK_COLORS)
+
+
+def chunked(rows: Iterable[GenomeRow], size: int) -> Iterator[List[GenomeRow]]:
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+GRAM_KEYS = ("positive", "negative", "neutral")
+FACTOID_HEIGHT = 56
+RULE_WIDTH = 0.5
+
+
+def card_frame_form(gram_key: str) -> str:
+    return f"card_frame_{gram_key}"
 
 
-def chunked(rows: Sequence[GenomeRow], size: int) -> List[List[GenomeRow]]:
-    return [list(rows[i : i + size]) for i in range(0, len(rows), size)]
+def opaque(color: colors.Color) -> colors.Color:
+    return colors.Color(color.red, color.green, color.blue)
+
+
+def define_card_forms(c: canvas.Canvas, include_backs: bool) -> None:
+    # Static card geometry is stored once as Form XObjects and instanced per card.
+    # ReportLab forms carry no ExtGState resources, so colours inside a form are
+    # opaque and draw_form applies the alpha from the calling page.
+    bleed = CARD_BORDER_WIDTH
+    for gram_key in GRAM_KEYS:
+        c.beginForm(card_frame_form(gram_key), -bleed, -bleed, CARD_WIDTH + bleed, CARD_HEIGHT + bleed)
+        c.setFillColor(opaque(CARD_BG))
+        c.setStrokeColor(opaque(gram_border_color(gram_key, CARD_BORDER)))
+        c.setLineWidth(CARD_BORDER_WIDTH)
+        c.roundRect(0, 0, CARD_WIDTH, CARD_HEIGHT, CARD_RADIUS, stroke=1, fill=1)
+        c.endForm()
+
+    factoid_width = CARD_WIDTH - 2 * CARD_PADDING
+    c.beginForm("factoid_box", -bleed, -bleed, factoid_width + bleed, FACTOID_HEIGHT + bleed)
+    c.setFillColor(opaque(FACTOID_BG))
+    c.setStrokeColor(opaque(FACTOID_BORDER))
+    c.setLineWidth(RULE_WIDTH)
+    c.roundRect(0, 0, factoid_width, FACTOID_HEIGHT, 6, stroke=1, fill=1)
+    c.endForm()
+
+    if not include_backs:
+        return
+    c.beginForm("card_back", -bleed, -bleed, CARD_WIDTH + bleed, CARD_HEIGHT + bleed)
+    draw_card_back(c, 0, 0)
+    c.endForm()
+
+
+def draw_form(
+    c: canvas.Canvas, name: str, x: float, y: float, fill_alpha: float = 1, stroke_alpha: float = 1
+) -> None:
+    c.saveState()
+    c.translate(x, y)
+    c.setFillAlpha(fill_alpha)
+    c.setStrokeAlpha(stroke_alpha)
+    c.doForm(name)
+    c.restoreState()
 
 
 def draw_card(c: canvas.Canvas, x: float, y: float, row: GenomeRow) -> None:
-    # Palette loosely matches the web UI
-    card_bg = hex_color("fff9f0")
-    card_border = hex_color("1f2326")
-    accent = hex_color("ff8f2f")
-    ink = hex_color("12202a")
-    ink_soft = hex_color("3d4a55")
-    factoid_bg = colors.Color(0.07, 0.12, 0.16, alpha=0.06)
-
-    radius = 14
-    padding = 12
+    padding = CARD_PADDING
     top_offset = 8
 
     gram_key = gram_key_from_value(row.gram_stain)
-    gram_border = gram_border_color(gram_key, card_border)
-    c.setFillColor(card_bg)
-    c.setStrokeColor(gram_border)
-    c.setLineWidth(2.2)
-    c.roundRect(x, y, CARD_WIDTH, CARD_HEIGHT, radius, stroke=1, fill=1)
+    gram_border = gram_border_color(gram_key, CARD_BORDER)
+    draw_form(c, card_frame_form(gram_key), x, y, CARD_BG.alpha, gram_border.alpha)
 
     if row.who_priority:
-        c.setFillColor(accent)
+        c.setFillColor(ACCENT)
         draw_star(c, x + CARD_WIDTH - padding - 8, y + CARD_HEIGHT - padding - 6, 6, 2.8)
 
     # Title
@@ -251,10 +333,9 @@ def draw_card(c: canvas.Canvas, x: float, y: float, row: GenomeRow) -> None:
     badge_padding = 6
     badge_y = title_y + 8
     c.setFont(FONT_DISPLAY, 7.2)
-    badge_text_width = stringWidth(phylum.upper(), FONT_DISPLAY, 7.2)
+    badge_text_width = string_width(phylum.upper(), FONT_DISPLAY, 7.2)
     badge_width = badge_text_width + badge_padding * 2
     c.setFillColor(phylum_bg)
-    c.setStrokeColor(colors.Color(0, 0, 0, alpha=0))
     c.roundRect(title_x, badge_y, badge_width, badge_height, 8, stroke=0, fill=1)
     c.setFillColor(phylum_text)
     c.drawString(title_x + badge_padding, badge_y + 4, phylum.upper())
@@ -262,7 +343,7 @@ def draw_card(c: canvas.Canvas, x: float, y: float, row: GenomeRow) -> None:
     # Gram indicator pill
     gram_text, gram_label = gram_label_from_key(gram_key, row.gram_stain)
     gram_bg, gram_text_color = gram_pill_colors(gram_key)
-    gram_width = stringWidth(gram_text, FONT_DISPLAY, 7.2) + badge_padding * 2
+    gram_width = string_width(gram_text, FONT_DISPLAY, 7.2) + badge_padding * 2
     gram_x = title_x + badge_width + 6
     c.setFillColor(gram_bg)
     c.roundRect(gram_x, badge_y, gram_width, badge_height, 8, stroke=0, fill=1)
@@ -270,8 +351,7 @@ def draw_card(c: canvas.Canvas, x: float, y: float, row: GenomeRow) -> None:
     c.drawString(gram_x + badge_padding, badge_y + 4, gram_text)
 
     title_y -= 8
-    c.setFillColor(ink)
-    c.setFont(FONT_DISPLAY_BOLD, 11)
+    c.setFillColor(INK)
     title_lines = wrap_text(display_species, FONT_DISPLAY_BOLD, 11, CARD_WIDTH - 2 * padding)
     for line in title_lines[:2]:
         draw_italic_line(c, title_x, title_y, line, FONT_DISPLAY_BOLD, 11)
@@ -281,7 +361,7 @@ def draw_card(c: canvas.Canvas, x: float, y: float, row: GenomeRow) -> None:
     strain = row.display_strain_name or row.strain
     if strain:
         subtitle = f"{subtitle} • {strain}"
-    c.setFillColor(ink_soft)
+    c.setFillColor(INK_SOFT)
     c.setFont(FONT_MONO, 8.2)
     subtitle_lines = wrap_text(subtitle, FONT_MONO, 8.2, CARD_WIDTH - 2 * padding)
     for line in subtitle_lines[:2]:
@@ -289,37 +369,30 @@ def draw_card(c: canvas.Canvas, x: float, y: float, row: GenomeRow) -> None:
         title_y -= 10
 
     # Metrics
-    metrics_top = title_y - 10
-    for label, key in METRICS:
-        value = getattr(row, key)
-        c.setFillColor(ink_soft)
-        c.setFont(FONT_DISPLAY, 8.0)
-        c.drawString(title_x, metrics_top, label)
-        c.setFillColor(ink)
-        c.setFont(FONT_DISPLAY_BOLD, 9.0)
-        c.drawRightString(x + CARD_WIDTH - padding, metrics_top, format_metric(value))
-        c.setStrokeColor(colors.Color(0.07, 0.12, 0.16, alpha=0.18))
-        c.setLineWidth(0.5)
-        c.line(title_x, metrics_top - 4, x + CARD_WIDTH - padding, metrics_top - 4)
-        metrics_top -= 13
+    # Drawn as three passes (labels, values, rules) so each sets its font and colour once.
+    metrics_right = x + CARD_WIDTH - padding
+    metric_ys = [title_y - 10 - 13 * i for i in range(len(METRICS))]
+    c.setFillColor(INK_SOFT)
+    c.setFont(FONT_DISPLAY, 8.0)
+    for (label, _, _), metric_y in zip(METRICS, metric_ys):
+        c.drawString(title_x, metric_y, label)
+    c.setFillColor(INK)
+    c.setFont(FONT_DISPLAY_BOLD, 9.0)
+    for (_, getter, formatter), metric_y in zip(METRICS, metric_ys):
+        value = getter(row)
+        c.drawRightString(metrics_right, metric_y, "N/A" if value is None else formatter(value))
+    c.setStrokeColor(METRIC_RULE)
+    c.setLineWidth(RULE_WIDTH)
+    for metric_y in metric_ys:
+        c.line(title_x, metric_y - 4, metrics_right, metric_y - 4)
 
     # Factoid box
-    factoid_height = 56
+    factoid_height = FACTOID_HEIGHT
     factoid_y = y + padding + 2
-    c.setFillColor(factoid_bg)
-    c.setStrokeColor(colors.Color(0.07, 0.12, 0.16, alpha=0.15))
-    c.roundRect(
-        x + padding,
-        factoid_y,
-        CARD_WIDTH - 2 * padding,
-        factoid_height,
-        6,
-        stroke=1,
-        fill=1,
-    )
+    draw_form(c, "factoid_box", x + padding, factoid_y, FACTOID_BG.alpha, FACTOID_BORDER.alpha)
 
     factoid_text = row.factoid or "Factoid coming soon."
-    c.setFillColor(ink)
+    c.setFillColor(INK)
     c.setFont(FONT_BODY, 8.2)
     lines = wrap_text(factoid_text, FONT_BODY, 8.2, CARD_WIDTH - 2 * padding - 6)
     text_y = factoid_y + factoid_height - 12
@@ -328,42 +401,40 @@ def draw_card(c: canvas.Canvas, x: float, y: float, row: GenomeRow) -> None:
         text_y -= 11
 
 
-def draw_card_back(c: canvas.Canvas, x: float, y: float) -> None:
-    card_bg = hex_color("fff9f0")
-    card_border = hex_color("1f2326")
-    accent = hex_color("ff8f2f")
-    ink = hex_color("12202a")
+# 25% orange pre-composited over the card background: the back is drawn inside a form, which has no alpha.
+EMBLEM_FILL = colors.linearlyInterpolatedColor(CARD_BG, colors.Color(1, 0.56, 0.18), 0, 1, 0.25)
+TICK_OFFSETS = tuple(CARD_PADDING + i * 6 for i in range(6))
 
-    radius = 14
-    padding = 12
 
-    c.setFillColor(card_bg)
-    c.setStrokeColor(card_border)
+def draw_card_back(c: canvas.Canvas, x: float, y: float) -> None:
+    c.setFillColor(CARD_BG)
+    c.setStrokeColor(CARD_BORDER)
     c.setLineWidth(2)
-    c.roundRect(x, y, CARD_WIDTH, CARD_HEIGHT, radius, stroke=1, fill=1)
+    c.roundRect(x, y, CARD_WIDTH, CARD_HEIGHT, CARD_RADIUS, stroke=1, fill=1)
 
     # Center emblem
     emblem_size = 120
     emblem_x = x + (CARD_WIDTH - emblem_size) / 2
     emblem_y = y + (CARD_HEIGHT - emblem_size) / 2
-    c.setFillColor(colors.Color(1, 0.56, 0.18, alpha=0.25))
-    c.setStrokeColor(card_border)
+    c.setFillColor(EMBLEM_FILL)
+    c.setStrokeColor(CARD_BORDER)
     c.setLineWidth(1.5)
     c.roundRect(emblem_x, emblem_y, emblem_size, emblem_size, 16, stroke=1, fill=1)
 
-    c.setFillColor(ink)
+    c.setFillColor(INK)
     c.setFont(FONT_DISPLAY_BOLD, 20)
     c.drawCentredString(x + CARD_WIDTH / 2, emblem_y + emblem_size / 2 + 8, "GC")
     c.setFont(FONT_DISPLAY, 9.5)
     c.drawCentredString(x + CARD_WIDTH / 2, emblem_y + emblem_size / 2 - 10, "Genome Clash")
 
     # Decorative border ticks
-    c.setStrokeColor(accent)
+    c.setStrokeColor(ACCENT)
     c.setLineWidth(1.2)
-    for i in range(6):
-        offset = padding + i * 6
-        c.line(x + offset, y + padding, x + offset + 3, y + padding)
-        c.line(x + CARD_WIDTH - offset, y + CARD_HEIGHT - padding, x + CARD_WIDTH - offset - 3, y + CARD_HEIGHT - padding)
+    bottom = y + CARD_PADDING
+    top = y + CARD_HEIGHT - CARD_PADDING
+    for offset in TICK_OFFSETS:
+        c.line(x + offset, bottom, x + offset + 3, bottom)
+        c.line(x + CARD_WIDTH - offset, top, x + CARD_WIDTH - offset - 3, top)
 
 
 def compute_grid(page_width: float, page_height: float) -> tuple[float, float, float, float]:
@@ -384,7 +455,8 @@ def build_pdf(rows: List[GenomeRow], output: Path, include_backs: bool) -> None:
 
     register_fonts()
     output.parent.mkdir(parents=True, exist_ok=True)
-    c = canvas.Canvas(str(output), pagesize=A4)
+    c = canvas.Canvas(str(output), pagesize=A4, pageCompression=1)
+    define_card_forms(c, include_backs)
 
     per_page = COLS * ROWS
     for page_rows in chunked(rows, per_page):
@@ -403,7 +475,7 @@ def build_pdf(rows: List[GenomeRow], output: Path, include_backs: bool) -> None:
                 row_idx = idx // COLS
                 x = margin_x + col * (CARD_WIDTH + gap_x)
                 y = page_height - margin_y - CARD_HEIGHT - row_idx * (CARD_HEIGHT + gap_y)
-                draw_card_back(c, x, y)
+                draw_form(c, "card_back", x, y)
             c.showPage()
 
     c.save()
@@ -430,6 +502,8 @@ def parse_args() -> argparse.Namespace:
 
 
 def register_fonts() -> None:
+    if FONT_DISPLAY in pdfmetrics.getRegisteredFontNames():
+        return
     missing = [
         p for p in (DISPLAY_REGULAR, DISPLAY_BOLD, BODY_REGULAR, BODY_SEMIBOLD, BODY_ITALIC) if not p.exists()
     ]
@@ -6,32 +6,41 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
+
+TAXID_LINE_RE = re.compile(r"^[^\S\n]*(\d+)[^\S\n]*(?:[,\t]|$)", re.MULTILINE)
 
 
 def read_taxids(path: Path) -> List[str]:
-    taxids: List[str] = []
-    for line in path.read_text().splitlines():
-        raw = line.strip()
-        if not raw or raw.startswith("#"):
-            continue
-        if "," in raw or "\t" in raw:
-            raw = raw.replace("\t", ",")
-            first = raw.split(",", 1)[0].strip()
-        else:
-            first = raw
-        if not first.isdigit():
-            continue
-        taxids.append(first)
-    return taxids
+    # First comma/tab separated field of each line, kept only when it is all digits; comments never match.
+    return TAXID_LINE_RE.findall(path.read_text())
 
 
 def normalize_taxid(value: str) -> str:
     return value.strip()
 
 
+def parse_json_lines(output: bytes) -> List[Dict[str, object]]:
+    records: List[Dict[str, object]] = []
+    for line in output.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        records.append(json_loads(line))
+    return records
+
+
 def run_summary(taxon: str, assembly_source: str, assembly_level: str, limit: Optional[int]) -> List[Dict[str, object]]:
     args = [
         "datasets",
@@ -49,14 +58,25 @@ def run_summary(taxon: str, assembly_source: str, assembly_level: str, limit: Op
     if limit:
         args += ["--limit", str(limit)]
 
-    result = subprocess.run(args, check=True, capture_output=True, text=True)
-    records: List[Dict[str, object]] = []
-    for line in result.stdout.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        records.append(json.loads(line))
-    return records
+    result = subprocess.run(args, check=True, capture_output=True)
+    return parse_json_lines(result.stdout)
+
+
+def fetch_summary(
+    taxon: str, assembly_source: str, assembly_level: str, limit: Optional[int]
+) -> Tuple[str, Optional[List[Dict[str, object]]]]:
+    try:
+        return taxon, run_summary(taxon, assembly_source, assembly_level, limit)
+    except subprocess.CalledProcessError as exc:
+        if taxon.lower().startswith("taxid:"):
+            print(f"Failed to fetch summary for {taxon}: {exc}")
+            return taxon, None
+    taxon_prefixed = f"taxid:{taxon}"
+    try:
+        return taxon_prefixed, run_summary(taxon_prefixed, assembly_source, assembly_level, limit)
+    except subprocess.CalledProcessError as exc_prefixed:
+        print(f"Failed to fetch summary for {taxon_prefixed}: {exc_prefixed}")
+        return taxon_prefixed, None
 
 
 def extract_row(record: Dict[str, object], taxid_input: str) -> Dict[str, object]:
@@ -91,10 +111,12 @@ def write_csv(rows: List[Dict[str, object]], path: Path) -> None:
     if not rows:
         return
     path.parent.mkdir(parents=True, exist_ok=True)
+    fieldnames = list(rows[0].keys())
+    table = [[row.get(field, "") for field in fieldnames] for row in rows]
     with path.open("w", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=list(rows[0].keys()))
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(table)
 
 
 def parse_args() -> argparse.Namespace:
@@ -113,6 +135,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional output CSV path (default: none).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Parallel datasets summary queries (default: 8).",
+    )
     return parser.parse_args()
 
 
@@ -123,25 +151,21 @@ def main() -> int:
         print("No taxids found.")
         return 1
 
+    taxa = [normalize_taxid(raw) for raw in taxids]
+    fetched: Dict[str, Tuple[str, Optional[List[Dict[str, object]]]]] = {}
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(fetch_summary, taxon, args.assembly_source, args.assembly_level, args.limit): taxon
+            for taxon in dict.fromkeys(taxa)
+        }
+        for future in as_completed(futures):
+            fetched[futures[future]] = future.result()
+
     rows: List[Dict[str, object]] = []
-    for raw in taxids:
-        taxon = normalize_taxid(raw)
-        try:
-            records = run_summary(taxon, args.assembly_source, args.assembly_level, args.limit)
-        except subprocess.CalledProcessError as exc:
-            if not taxon.lower().startswith("taxid:"):
-                taxon_prefixed = f"taxid:{taxon}"
-                try:
-                    records = run_summary(
-                        taxon_prefixed, args.assembly_source, args.assembly_level, args.limit
-                    )
-                    taxon = taxon_prefixed
-                except subprocess.CalledProcessError as exc_prefixed:
-                    print(f"Failed to fetch summary for {taxon_prefixed}: {exc_prefixed}")
-                    continue
-            else:
-                print(f"Failed to fetch summary for {taxon}: {exc}")
-                continue
+    for raw, taxon in zip(taxids, taxa):
+        taxon, records = fetched[taxon]
+        if records is None:
+            continue
 
         if not records:
             print(f"No assemblies returned for {taxon}")